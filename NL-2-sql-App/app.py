@@ -1,5 +1,9 @@
 """Main Streamlit Application"""
 import os
+import sqlite3
+import chromadb
+from chromadb.config import Settings
+import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
 from backend.pipeline import NL2SQLPipeline, PipelineConfig
@@ -30,6 +34,12 @@ schema_tables = {
     "employees": ["id", "branch_id", "name", "email", "phone", "position", "hire_date", "salary", "created_at", "updated_at"],
     "transactions": ["id", "account_id", "transaction_date", "amount", "type", "description", "status", "created_at", "updated_at", "employee_id"]
 }
+
+@st.cache_resource
+def get_chroma_client():
+    """Create the ChromaDB client once and reuse it across reruns"""
+    return chromadb.PersistentClient(path=CHROMA_PATH, settings=Settings(anonymized_telemetry=False))
+
 def show_system_status():
     """Display system initialization status"""
     st.sidebar.markdown("### 🔧 System Status")
@@ -38,7 +48,6 @@ def show_system_status():
     if os.path.exists(DB_PATH):
         st.sidebar.success("✅ Database: Connected")
         try:
-            import sqlite3
             conn = sqlite3.connect(DB_PATH)
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table';")
@@ -62,9 +71,7 @@ def show_system_status():
     if os.path.exists(CHROMA_PATH):
         st.sidebar.success("✅ ChromaDB: Connected")
         try:
-            import chromadb
-            client = chromadb.PersistentClient(path=CHROMA_PATH)
-            collection = client.get_collection("database_schema")
+            collection = get_chroma_client().get_collection("database_schema")
             st.sidebar.markdown(f"📚 Schema Embeddings: {collection.count()} chunks")
         except Exception as e:
             st.sidebar.error(f"❌ ChromaDB Error: {str(e)}")
@@ -122,7 +129,7 @@ def initialize_pipeline():
 
     return NL2SQLPipeline(
         planner=PlannerAgent(schema_tables),
-        retriever=RetrieverAgent(db_path=CHROMA_PATH),
+        retriever=RetrieverAgent(db_path=CHROMA_PATH, client=get_chroma_client()),
         generator=generator,
         validator=ValidatorAgent(schema_tables),
         executor=ExecutorAgent(DB_PATH),
@@ -190,7 +197,6 @@ with main_tab:
                     
                     if response.get("table"):
                         st.subheader("📋 Results")
-                        import pandas as pd
                         
                         # Display execution message if available
                         if response.get("execution_message"):
@@ -246,7 +252,6 @@ with main_tab:
                 # Show results
                 if resp.get("table"):
                     st.subheader("📋 Results")
-                    import pandas as pd
                     
                     # Display execution message if available
                     if resp.get("execution_message"):
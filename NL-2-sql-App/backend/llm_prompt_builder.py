@@ -1,14 +1,103 @@
 """LLM Prompt Builder with Schema-Infused, Few-Shot, and Chain-of-Thought Prompting"""
 import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple, Deque
 from dataclasses import dataclass, field
 from datetime import datetime
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of past queries kept in a prompt context's history
+MAX_QUERY_HISTORY = 3
+
+# Static prompt sections, built once and shared by every build_prompt call
+CRITICAL_REQUIREMENTS = {
+    "schema_adherence": [
+        "ONLY use columns that exist in the provided schema metadata",
+        "Verify each column name against the schema before using",
+        "Check data types and constraints from schema"
+    ],
+    "aggregation_guidelines": [
+        "Add COUNT, SUM, AVG where relevant to provide insights",
+        "Include GROUP BY when using aggregations",
+        "Consider HAVING clauses for aggregate filters"
+    ],
+    "join_validation": [
+        "Verify all required joins based on foreign key relationships",
+        "Use appropriate JOIN types (LEFT, INNER) based on requirements",
+        "Include all necessary join conditions"
+    ],
+    "where_conditions": [
+        "Add status='active' checks where applicable",
+        "Include date range filters when temporal context exists",
+        "Validate values against domain constraints"
+    ]
+}
+
+ANALYSIS_STEPS = [
+    "1. Identify entities and columns from schema metadata",
+    "2. Map identified elements to relevant tables/columns",
+    "3. Plan necessary joins using foreign key relationships",
+    "4. Determine required aggregations and grouping",
+    "5. Add appropriate WHERE conditions and filters",
+    "6. Structure the final SQL query",
+    "7. Validate against schema constraints",
+    "8. Provide reasoning for choices made"
+]
+
+OUTPUT_FORMAT = {
+    "type": "json",
+    "structure": {
+        "SQLQuery": "The executable SQL query that fulfills the request",
+        "Suggestion": "A natural language description of what the SQL query does",
+        "Reasoning": {
+            "identified_entities": ["List of tables and columns identified"],
+            "join_logic": ["Explanation of join relationships used"],
+            "aggregation_choices": ["Why certain aggregations were added"],
+            "filter_conditions": ["Reasoning for WHERE conditions"]
+        }
+    }
+}
+
+PROMPT_REQUIREMENTS = {
+    "output_format": [
+        "Return a JSON object with SQLQuery, Suggestion, and Reasoning",
+        "SQLQuery must contain only the executable SQL query",
+        "Suggestion must provide a clear description of the query's purpose",
+        "Reasoning must explain all key decisions made"
+    ],
+    "schema_validation": [
+        "Verify every column exists in schema",
+        "Check data types match schema",
+        "Validate against domain constraints"
+    ],
+    "join_requirements": [
+        "Use proper table aliases",
+        "Include all necessary join conditions",
+        "Follow foreign key relationships"
+    ],
+    "aggregation_rules": [
+        "Add appropriate GROUP BY clauses",
+        "Consider HAVING for aggregate filters",
+        "Use DISTINCT when needed"
+    ],
+    "filter_guidelines": [
+        "Add status checks where relevant",
+        "Include date filters when needed",
+        "Validate literal values"
+    ]
+}
+
+CORRECTION_FOCUS = [
+    "Verify column names against schema",
+    "Check join conditions",
+    "Validate value domains",
+    "Review aggregation logic"
+]
+
+@dataclass(slots=True)
 class QueryExample:
     """Stores example NL queries and their SQL translations with reasoning"""
     nl_query: str
@@ -19,7 +108,7 @@ class QueryExample:
     key_columns: List[str]
     conditions: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class QueryHistory:
     """Stores history of NL queries and their SQL translations"""
     nl_query: str
@@ -35,7 +124,7 @@ class PromptContext:
     """Maintains context for the prompting session"""
     schema_metadata: Dict[str, Any]
     foreign_keys: Dict[str, List[Dict[str, str]]]
-    query_history: List[QueryHistory] = field(default_factory=list)
+    query_history: Deque[QueryHistory] = field(default_factory=lambda: deque(maxlen=MAX_QUERY_HISTORY))
     conversation_context: Dict[str, Any] = field(default_factory=dict)
 
 class PromptingAgent:
@@ -43,7 +132,7 @@ class PromptingAgent:
 
     def __init__(self):
         self.context: Optional[PromptContext] = None
-        self.max_history = 3
+        self.max_history = MAX_QUERY_HISTORY
         self.example_queries = self._initialize_example_queries()
         logger.info("🔄 Initialized PromptingAgent")
 
@@ -120,7 +209,7 @@ class PromptingAgent:
             self.context = PromptContext(
                 schema_metadata=schema_metadata,
                 foreign_keys=foreign_keys,
-                query_history=[],
+                query_history=deque(maxlen=self.max_history),
                 conversation_context={}
             )
             
@@ -140,17 +229,17 @@ class PromptingAgent:
                         raise ValueError(f"Invalid foreign key format in table {table}")
             
             # Log successful initialization
-            table_info = {
-                table: {
-                    "columns": len(table_data.get("columns", {})),
-                    "has_description": bool(table_data.get("description")),
-                    "foreign_keys": len(foreign_keys.get(table, []))
-                }
-                for table, table_data in schema_metadata.get("tables", {}).items()
-            }
-            
             logger.info("✅ Context initialization complete")
-            logger.debug(f"Table information:\n{json.dumps(table_info, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                table_info = {
+                    table: {
+                        "columns": len(table_data.get("columns", {})),
+                        "has_description": bool(table_data.get("description")),
+                        "foreign_keys": len(foreign_keys.get(table, []))
+                    }
+                    for table, table_data in schema_metadata.get("tables", {}).items()
+                }
+                logger.debug(f"Table information:\n{json.dumps(table_info, indent=2)}")
             
         except Exception as e:
             logger.error(f"❌ Error initializing context: {str(e)}")
@@ -345,57 +434,15 @@ class PromptingAgent:
             
             # Build the complete prompt structure
             prompt = {
-                "critical_requirements": {
-                    "schema_adherence": [
-                        "ONLY use columns that exist in the provided schema metadata",
-                        "Verify each column name against the schema before using",
-                        "Check data types and constraints from schema"
-                    ],
-                    "aggregation_guidelines": [
-                        "Add COUNT, SUM, AVG where relevant to provide insights",
-                        "Include GROUP BY when using aggregations",
-                        "Consider HAVING clauses for aggregate filters"
-                    ],
-                    "join_validation": [
-                        "Verify all required joins based on foreign key relationships",
-                        "Use appropriate JOIN types (LEFT, INNER) based on requirements",
-                        "Include all necessary join conditions"
-                    ],
-                    "where_conditions": [
-                        "Add status='active' checks where applicable",
-                        "Include date range filters when temporal context exists",
-                        "Validate values against domain constraints"
-                    ]
-                },
+                "critical_requirements": CRITICAL_REQUIREMENTS,
                 
-                "analysis_steps": [
-                    "1. Identify entities and columns from schema metadata",
-                    "2. Map identified elements to relevant tables/columns",
-                    "3. Plan necessary joins using foreign key relationships",
-                    "4. Determine required aggregations and grouping",
-                    "5. Add appropriate WHERE conditions and filters",
-                    "6. Structure the final SQL query",
-                    "7. Validate against schema constraints",
-                    "8. Provide reasoning for choices made"
-                ],
+                "analysis_steps": ANALYSIS_STEPS,
                 
                 "task": {
                     "objective": "Generate a SQLite SQL query",
                     "input_query": query,
                     "context": "Banking database query generation",
-                    "output_format": {
-                        "type": "json",
-                        "structure": {
-                            "SQLQuery": "The executable SQL query that fulfills the request",
-                            "Suggestion": "A natural language description of what the SQL query does",
-                            "Reasoning": {
-                                "identified_entities": ["List of tables and columns identified"],
-                                "join_logic": ["Explanation of join relationships used"],
-                                "aggregation_choices": ["Why certain aggregations were added"],
-                                "filter_conditions": ["Reasoning for WHERE conditions"]
-                            }
-                        }
-                    }
+                    "output_format": OUTPUT_FORMAT
                 },
                 
                 "schema_context": self._build_schema_infused_context(),
@@ -426,53 +473,19 @@ class PromptingAgent:
                     for ex in relevant_examples
                 ],
                 
-                "requirements": {
-                    "output_format": [
-                        "Return a JSON object with SQLQuery, Suggestion, and Reasoning",
-                        "SQLQuery must contain only the executable SQL query",
-                        "Suggestion must provide a clear description of the query's purpose",
-                        "Reasoning must explain all key decisions made"
-                    ],
-                    "schema_validation": [
-                        "Verify every column exists in schema",
-                        "Check data types match schema",
-                        "Validate against domain constraints"
-                    ],
-                    "join_requirements": [
-                        "Use proper table aliases",
-                        "Include all necessary join conditions",
-                        "Follow foreign key relationships"
-                    ],
-                    "aggregation_rules": [
-                        "Add appropriate GROUP BY clauses",
-                        "Consider HAVING for aggregate filters",
-                        "Use DISTINCT when needed"
-                    ],
-                    "filter_guidelines": [
-                        "Add status checks where relevant",
-                        "Include date filters when needed",
-                        "Validate literal values"
-                    ]
-                }
+                "requirements": PROMPT_REQUIREMENTS
             }
 
             if error_context:
                 prompt["error_context"] = {
                     "previous_error": error_context,
-                    "correction_focus": [
-                        "Verify column names against schema",
-                        "Check join conditions",
-                        "Validate value domains",
-                        "Review aggregation logic"
-                    ]
+                    "correction_focus": CORRECTION_FOCUS
                 }
 
             # Log the complete prompt structure as JSON
             prompt_json = json.dumps(prompt, indent=2)
-            logger.info("🤖 LLM PROMPT BUILDER - INPUT JSON:")
-            logger.info("=" * 80)
-            logger.info(prompt_json)
-            logger.info("=" * 80)
+            banner = "=" * 80
+            logger.info("\n".join(["🤖 LLM PROMPT BUILDER - INPUT JSON:", banner, prompt_json, banner]))
             
             logger.info("✅ Successfully built prompt")
             return prompt_json
@@ -622,9 +635,8 @@ Please provide the corrected SQL query:
             reasoning_steps=reasoning or []
         )
         
+        # Bounded deque drops the oldest entry once max_history is reached
         self.context.query_history.append(history_entry)
-        if len(self.context.query_history) > self.max_history:
-            self.context.query_history.pop(0)
         
         logger.info(f"📝 Added query to history (success: {success})")
 
@@ -56,29 +56,27 @@ class OpenAIProvider(LLMProvider):
     def generate_text(self, prompt: str, **kwargs) -> Optional[str]:
         """Generate text using OpenAI's chat completion"""
         try:
-            # Log the input prompt as JSON
-            logger.info("🤖 LLM PROVIDER - INPUT JSON:")
-            logger.info("=" * 80)
+            # Log the input prompt as JSON in a single record
+            banner = "=" * 80
+            input_lines = ["🤖 LLM PROVIDER - INPUT JSON:", banner]
             try:
                 # Check if prompt is already a dict
                 if isinstance(prompt, dict):
-                    logger.info(json.dumps(prompt, indent=2))
-                    logger.info("✅ Input is already a dictionary")
+                    input_lines.append(json.dumps(prompt, indent=2))
+                    input_lines.append("✅ Input is already a dictionary")
                 else:
                     # Try to parse as JSON for pretty printing
                     prompt_dict = json.loads(prompt)
-                    logger.info(json.dumps(prompt_dict, indent=2))
-                    logger.info("✅ Input successfully parsed as JSON")
+                    input_lines.append(json.dumps(prompt_dict, indent=2))
+                    input_lines.append("✅ Input successfully parsed as JSON")
             except json.JSONDecodeError:
                 # If not JSON, log as regular text
-                logger.info("Raw prompt (not JSON):")
-                logger.info(prompt)
-                logger.info("⚠️ Input is not valid JSON format")
+                input_lines.extend(["Raw prompt (not JSON):", str(prompt), "⚠️ Input is not valid JSON format"])
             except Exception as e:
                 logger.error(f"Error processing prompt: {str(e)}")
-                logger.info("Raw prompt:")
-                logger.info(prompt)
-            logger.info("=" * 80)
+                input_lines.extend(["Raw prompt:", str(prompt)])
+            input_lines.append(banner)
+            logger.info("\n".join(input_lines))
             
             # Log additional parameters
             if kwargs:
@@ -97,14 +95,17 @@ class OpenAIProvider(LLMProvider):
                 max_tokens=max_tokens
             )
             
-            # Log the raw response
-            logger.info("🤖 LLM PROVIDER - RAW RESPONSE:")
-            logger.info("=" * 80)
-            logger.info(f"Response object: {response}")
-            logger.info(f"Choices count: {len(response.choices) if response.choices else 0}")
+            # Log the raw response as a single record
+            raw_lines = [
+                "🤖 LLM PROVIDER - RAW RESPONSE:",
+                banner,
+                f"Response object: {response}",
+                f"Choices count: {len(response.choices) if response.choices else 0}"
+            ]
             if response.choices:
-                logger.info(f"First choice content: {response.choices[0].message.content if response.choices[0].message else 'No content'}")
-            logger.info("=" * 80)
+                raw_lines.append(f"First choice content: {response.choices[0].message.content if response.choices[0].message else 'No content'}")
+            raw_lines.append(banner)
+            logger.info("\n".join(raw_lines))
             
             if not response.choices:
                 logger.error("❌ OpenAI returned empty choices")
@@ -112,20 +113,18 @@ class OpenAIProvider(LLMProvider):
                 
             generated_text = response.choices[0].message.content
             
-            # Log the final output as JSON
-            logger.info("🤖 LLM PROVIDER - OUTPUT JSON:")
-            logger.info("=" * 80)
+            # Log the final output as JSON in a single record
+            output_lines = ["🤖 LLM PROVIDER - OUTPUT JSON:", banner]
             try:
                 # Try to parse as JSON for pretty printing
                 response_dict = json.loads(generated_text)
-                logger.info(json.dumps(response_dict, indent=2))
-                logger.info("✅ Response successfully parsed as JSON")
+                output_lines.append(json.dumps(response_dict, indent=2))
+                output_lines.append("✅ Response successfully parsed as JSON")
             except json.JSONDecodeError:
                 # If not JSON, log as regular text
-                logger.info("Response (not JSON):")
-                logger.info(generated_text)
-                logger.info("⚠️ Response is not valid JSON format")
-            logger.info("=" * 80)
+                output_lines.extend(["Response (not JSON):", str(generated_text), "⚠️ Response is not valid JSON format"])
+            output_lines.append(banner)
+            logger.info("\n".join(output_lines))
             
             # Log success with green tick
             logger.info("✅ LLM interaction completed successfully")
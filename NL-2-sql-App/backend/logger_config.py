@@ -34,7 +34,8 @@ class AgentLogger:
         # Store the original data structures
         self.agent_states[agent_name] = state
         self.flow_history.append({
-            'timestamp': datetime.now().isoformat(),
+            # Reuse the timestamp the decorator already stamped on the state
+            'timestamp': state.get('timestamp') or datetime.now().isoformat(),
             'agent': agent_name,
             'state': state
         })
@@ -36,12 +36,12 @@ class NL2SQLPipeline:
 
     def run(self, nl_query: str, clarified_values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         diag = PipelineDiagnostics()
-        start_all = time.time()
+        start_all = time.perf_counter()
 
         # 1) Plan
-        t0 = time.time()
+        t0 = time.perf_counter()
         plan = self.planner.analyze_query(nl_query)
-        diag.timings_ms["planning"] = int((time.time() - t0) * 1000)
+        diag.timings_ms["planning"] = int((time.perf_counter() - t0) * 1000)
         diag.chosen_tables = plan.get("tables", [])
         diag.detected_capabilities = plan.get("capabilities", [])
         
@@ -57,18 +57,17 @@ class NL2SQLPipeline:
 
         logger.info(f" after the line if conditionclar=plan.get")
         # 2) Retrieve context
-        t1 = time.time()
+        t1 = time.perf_counter()
 
         logger.info(f" L62")
         # Convert table list to query string for retriever
-        tables_list = plan.get("tables", [])
         logger.info(f" L65")
-        retrieval_query = f"tables: {' '.join(tables_list)} query: {nl_query}"
+        retrieval_query = f"tables: {' '.join(diag.chosen_tables)} query: {nl_query}"
         logger.info(f" L67")
         logger.info(f"🔍 Calling Retriever with query: {retrieval_query}")
         ctx_bundle = self.retriever.fetch_schema_context(retrieval_query)
         logger.info(f" L70")
-        diag.timings_ms["retrieval"] = int((time.time() - t1) * 1000)
+        diag.timings_ms["retrieval"] = int((time.perf_counter() - t1) * 1000)
         logger.info(f" L72")
 
         # Prepare comprehensive generation context
@@ -82,8 +81,8 @@ class NL2SQLPipeline:
             
             # Planner's rich context
             "metadata_context": plan.get("metadata_context", {}),
-            "detected_capabilities": plan.get("capabilities", []),
-            "detected_tables": plan.get("tables", []),
+            "detected_capabilities": diag.detected_capabilities,
+            "detected_tables": diag.chosen_tables,
             "conversation_state": plan.get("conversation_state", {}),
             "clarified_values": clarified_values or {},
             
@@ -92,8 +91,8 @@ class NL2SQLPipeline:
             
             # Planner's analysis
             "planner_analysis": {
-                "capabilities": plan.get("capabilities", []),
-                "tables": plan.get("tables", []),
+                "capabilities": diag.detected_capabilities,
+                "tables": diag.chosen_tables,
                 "steps": plan.get("steps", [])
             }
         }
@@ -105,19 +104,19 @@ class NL2SQLPipeline:
             logger.info(f"- Clarified Values: {clarified_values}")
 
         # 3) Generate SQL
-        t2 = time.time()
+        t2 = time.perf_counter()
         sql = self.generator.generate(nl_query, ctx_bundle, gen_ctx, self.schema_tables)
         diag.generated_sql = sql
-        diag.timings_ms["generation"] = int((time.time() - t2) * 1000)
+        diag.timings_ms["generation"] = int((time.perf_counter() - t2) * 1000)
 
         attempts = 0
         last_error = None
         while attempts <= self.cfg.max_retries:
             # 4) Validate
-            t3 = time.time()
+            t3 = time.perf_counter()
             validation_result = self.validator.validate(sql)
             diag.timings_ms.setdefault("validation", 0)
-            diag.timings_ms["validation"] += int((time.time() - t3) * 1000)
+            diag.timings_ms["validation"] += int((time.perf_counter() - t3) * 1000)
 
             if not validation_result.get("is_valid", False):
                 reason = validation_result.get("error", "unknown validation error")
@@ -131,17 +130,17 @@ class NL2SQLPipeline:
                 continue
 
             # 5) Execute
-            t4 = time.time()
+            t4 = time.perf_counter()
             exec_result = self.executor.run_query(sql, limit=self.cfg.sql_row_limit, validation_context=validation_result)
-            diag.timings_ms["execution"] = int((time.time() - t4) * 1000)
+            diag.timings_ms["execution"] = int((time.perf_counter() - t4) * 1000)
 
             if exec_result.get("success"):
                 diag.final_sql = sql
                 diag.retries = attempts
                 # 6) Summarize
-                t5 = time.time()
+                t5 = time.perf_counter()
                 out = self.summarizer.summarize(nl_query, exec_result)
-                diag.timings_ms["summarization"] = int((time.time() - t5) * 1000)
+                diag.timings_ms["summarization"] = int((time.perf_counter() - t5) * 1000)
                 
                 # Build comprehensive output
                 out.update({
@@ -150,7 +149,7 @@ class NL2SQLPipeline:
                     "success": True,
                     "generated_sql": diag.generated_sql,
                     "suggestions": plan.get("follow_up_suggestions", []),
-                    "capabilities": plan.get("capabilities", []),
+                    "capabilities": diag.detected_capabilities,
                     "tables_used": diag.chosen_tables,
                     "execution_info": {
                         "retries": diag.retries,
@@ -173,13 +172,13 @@ class NL2SQLPipeline:
             sql = self.generator.repair_sql(nl_query, gen_ctx, hint=err)
 
         # Failed after retries
-        total_ms = int((time.time() - start_all) * 1000)
+        total_ms = int((time.perf_counter() - start_all) * 1000)
         diag.timings_ms["total"] = total_ms
         return {
             "success": False,
             "error": last_error or "Could not produce safe SQL",
             "sql": sql,
             "diagnostics": diag.__dict__,
-            "capabilities": plan.get("capabilities", []),
+            "capabilities": diag.detected_capabilities,
             "tables_attempted": diag.chosen_tables
         }
\ No newline at end of file
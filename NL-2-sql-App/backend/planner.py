@@ -24,6 +24,10 @@ class PlannerAgent:
     WINDOW_WORDS = ["consecutive", "consecutive days", "lag", "lead"]
     WEEKEND_WORDS = ["weekend", "saturday", "sunday"]
     THRESHOLD_WORDS = ["greater than", "less than", "above", "below", "minimum", "max", "at least", "more than"]
+    HIGH_VALUE_WORDS = ["high value", "high balance", "rich", "wealthy"]
+    TABLE_KEYWORDS = ["customer", "account", "transaction", "employee", "branch"]
+    NUMBER_PATTERN = re.compile(r"\b\d{2,}\b")
+    YEAR_PATTERN = re.compile(r"\b(20\d{2}|202\d)\b")
 
     def __init__(self, schema_map: Dict[str, List[str]], conversation_state: Optional[Dict[str, Any]] = None):
         """
@@ -58,21 +62,11 @@ class PlannerAgent:
         # Log heuristic matches
         if not found:
             heuristic_matches = []
-            if "customer" in tl: 
-                matches = [t for t in self.schema_map if "customer" in t]
-                heuristic_matches.extend([("customer", m) for m in matches])
-            if "account" in tl: 
-                matches = [t for t in self.schema_map if "account" in t]
-                heuristic_matches.extend([("account", m) for m in matches])
-            if "transaction" in tl or "transactions" in tl: 
-                matches = [t for t in self.schema_map if "transaction" in t]
-                heuristic_matches.extend([("transaction", m) for m in matches])
-            if "employee" in tl or "employees" in tl: 
-                matches = [t for t in self.schema_map if "employee" in t]
-                heuristic_matches.extend([("employee", m) for m in matches])
-            if "branch" in tl or "branches" in tl: 
-                matches = [t for t in self.schema_map if "branch" in t]
-                heuristic_matches.extend([("branch", m) for m in matches])
+            # Singular stems also cover plural mentions ("branch" matches "branches")
+            for keyword in self.TABLE_KEYWORDS:
+                if keyword in tl:
+                    matches = [t for t in self.schema_map if keyword in t]
+                    heuristic_matches.extend([(keyword, m) for m in matches])
             
             if heuristic_matches:
                 logger.info("\n📌 Found tables via heuristics:")
@@ -138,7 +132,7 @@ class PlannerAgent:
         metadata = self.metadata_loader.get_metadata()
         
         # threshold numeric missing
-        if any(k in tl for k in ["high value", "high balance", "rich", "wealthy"]) and not re.search(r"\b\d{2,}\b", text):
+        if any(k in tl for k in self.HIGH_VALUE_WORDS) and not self.NUMBER_PATTERN.search(text):
             # Check typical account balances from metadata if available
             default_threshold = 20000  # Default fallback
             if "accounts" in metadata.get('tables', {}):
@@ -153,7 +147,7 @@ class PlannerAgent:
             })
         
         # ambiguous timeframe
-        if "recent" in tl or "last" in tl and not re.search(r"\b(20\d{2}|202\d)\b", text):
+        if "recent" in tl or "last" in tl and not self.YEAR_PATTERN.search(text):
             clar.append({
                 "field": "date_range",
                 "prompt": "What date range do you mean by 'recent'?",
@@ -171,14 +165,16 @@ class PlannerAgent:
             })
         
         # Check for ambiguous account types
-        if "account" in tl and not any(acc_type in tl for acc_type in self.metadata_loader.get_distinct_values('accounts', 'type')):
-            clar.append({
-                "field": "account_type",
-                "prompt": "What type of account are you interested in?",
-                "type": "select",
-                "options": self.metadata_loader.get_distinct_values('accounts', 'type'),
-                "default": "checking"
-            })
+        if "account" in tl:
+            account_types = self.metadata_loader.get_distinct_values('accounts', 'type')
+            if not any(acc_type in tl for acc_type in account_types):
+                clar.append({
+                    "field": "account_type",
+                    "prompt": "What type of account are you interested in?",
+                    "type": "select",
+                    "options": account_types,
+                    "default": "checking"
+                })
         
         return clar
 
@@ -245,30 +241,31 @@ class PlannerAgent:
             "metadata_context": metadata_context
         }
 
-        # Log detailed analysis
-        analysis = {
-            "detected_tables": {
-                "tables_found": tables,
-                "total_tables": len(tables)
-            },
-            "detected_capabilities": {
-                "capabilities": capabilities,
-                "total_capabilities": len(capabilities)
-            },
-            "needs_clarification": len(clarifications) > 0,
-            "clarifications": clarifications,
-            "suggested_steps": steps,
-            "metadata_context_summary": {
-                table: {
-                    "description": meta.get("description", ""),
-                    "column_count": len(meta.get("columns", {}))
+        # Detailed analysis duplicates the plan below; only build it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            analysis = {
+                "detected_tables": {
+                    "tables_found": tables,
+                    "total_tables": len(tables)
+                },
+                "detected_capabilities": {
+                    "capabilities": capabilities,
+                    "total_capabilities": len(capabilities)
+                },
+                "needs_clarification": len(clarifications) > 0,
+                "clarifications": clarifications,
+                "suggested_steps": steps,
+                "metadata_context_summary": {
+                    table: {
+                        "description": meta.get("description", ""),
+                        "column_count": len(meta.get("columns", {}))
+                    }
+                    for table, meta in metadata_context.items()
                 }
-                for table, meta in metadata_context.items()
             }
-        }
         
-        logger.info("\n📋 PlannerAgent Analysis:")
-        logger.info(json.dumps(analysis, indent=2))
+            logger.debug("\n📋 PlannerAgent Analysis:")
+            logger.debug(json.dumps(analysis, indent=2))
         
         logger.info("\n📋 PlannerAgent Output Plan:")
         logger.info(json.dumps(plan, indent=2))
@@ -281,7 +278,7 @@ class PlannerAgent:
         suggestions = []
         
         # Branch-related suggestions
-        if "branch" in query_lower or "branches" in query_lower:
+        if "branch" in query_lower:
             if "transaction" in query_lower:
                 suggestions.extend([
                     "Show me the bottom 5 performing branches",
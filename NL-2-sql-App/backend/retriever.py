@@ -1,33 +1,71 @@
 """Retriever Agent for fetching schema context"""
 import chromadb
+from chromadb.api import ClientAPI
+from chromadb.config import Settings
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional
 from .logger_config import log_agent_flow
 from .metadata_loader import MetadataLoader
 
 logger = logging.getLogger(__name__)
 
 class RetrieverAgent:
-    def __init__(self, db_path: str = "./chroma_db"):
-        """Initialize with ChromaDB connection"""
+    # Seconds to skip ChromaDB after a failure before trying it again
+    BREAKER_RESET_SECONDS = 60.0
+
+    def __init__(self, db_path: str = "./chroma_db", client: Optional[ClientAPI] = None):
+        """Initialize with ChromaDB connection, reusing `client` when one is supplied"""
         self.db_path = db_path
-        self.client = chromadb.PersistentClient(path=db_path)
+        self.client = client if client is not None else chromadb.PersistentClient(
+            path=db_path, settings=Settings(anonymized_telemetry=False)
+        )
         self.schema_collection = self.client.get_or_create_collection("database_schema")
         self.metadata_loader = MetadataLoader()
+        self._breaker_opened_at: Optional[float] = None
         logger.info(f"RetrieverAgent initialized with path: {db_path}")
 
+    def _breaker_open(self) -> bool:
+        """True while a recent ChromaDB failure should short-circuit queries"""
+        if self._breaker_opened_at is None:
+            return False
+        if time.monotonic() - self._breaker_opened_at >= self.BREAKER_RESET_SECONDS:
+            # Cool-down elapsed - let the next call probe ChromaDB again
+            self._breaker_opened_at = None
+            return False
+        return True
+
+    def _trip_breaker(self):
+        """Record a ChromaDB failure so later calls go straight to the fallback"""
+        self._breaker_opened_at = time.monotonic()
+
+    def _query_schema(self, query_text: str, n_results: int) -> Optional[Dict[str, Any]]:
+        """Query the schema collection, or return None when ChromaDB is unavailable"""
+        if self._breaker_open():
+            logger.warning("ChromaDB circuit open, skipping schema query")
+            return None
+        try:
+            return self.schema_collection.query(
+                query_texts=[query_text],
+                n_results=n_results
+            )
+        except Exception as e:
+            # Only ChromaDB failures open the breaker
+            logger.error(f"❌ ChromaDB schema query failed: {str(e)}")
+            self._trip_breaker()
+            return None
+
     @log_agent_flow("RetrieverAgent")
     def fetch_schema_context(self, query: str) -> Dict[str, Any]:
         """Fetch relevant schema context for the query"""
         logger.info(f"🔍 RetrieverAgent called with query: {query}")
         
+        # Query schema collection for the top 3 most relevant schema chunks
+        results = self._query_schema(query, n_results=3)
+        if results is None:
+            return self._get_fallback_schema()
+        
         try:
-            # Query schema collection
-            results = self.schema_collection.query(
-                query_texts=[query],
-                n_results=3  # Get top 3 most relevant schema chunks
-            )
-            
             if not results["documents"] or not results["documents"][0]:
                 logger.warning("No schema context found in ChromaDB, using fallback")
                 return self._get_fallback_schema()
@@ -110,12 +148,9 @@ class RetrieverAgent:
         """Get columns for a specific table"""
         try:
             # First try ChromaDB
-            results = self.schema_collection.query(
-                query_texts=[f"table {table_name} columns"],
-                n_results=1
-            )
+            results = self._query_schema(f"table {table_name} columns", n_results=1)
             
-            if results["metadatas"]:
+            if results and results["metadatas"]:
                 columns_str = results["metadatas"][0][0].get('columns_str', '')
                 if columns_str:
                     return columns_str.split(', ')
@@ -135,12 +170,9 @@ class RetrieverAgent:
         """Get foreign key relationships for a table"""
         try:
             # First try ChromaDB
-            results = self.schema_collection.query(
-                query_texts=[f"table {table_name} foreign keys"],
-                n_results=1
-            )
+            results = self._query_schema(f"table {table_name} foreign keys", n_results=1)
             
-            if results["metadatas"]:
+            if results and results["metadatas"]:
                 fk_str = results["metadatas"][0][0].get('foreign_keys_str', '')
                 if fk_str:
                     fk_list = []
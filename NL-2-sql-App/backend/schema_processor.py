@@ -3,8 +3,9 @@ import os
 import logging
 from typing import List, Dict, Any
 import chromadb
+from chromadb.config import Settings
 from chromadb.utils import embedding_functions
-from openai import OpenAI
+from chromadb.utils.batch_utils import create_batches
 from dotenv import load_dotenv
 from .metadata_loader import MetadataLoader
 
@@ -13,12 +14,13 @@ logger = logging.getLogger(__name__)
 
 class SchemaProcessor:
     def __init__(self):
-        self.openai_client = OpenAI()
         self.embedding_function = embedding_functions.OpenAIEmbeddingFunction(
             api_key=os.getenv("OPENAI_API_KEY"),
             model_name="text-embedding-3-small"
         )
-        self.chroma_client = chromadb.PersistentClient(path="./chroma_db")
+        self.chroma_client = chromadb.PersistentClient(
+            path="./chroma_db", settings=Settings(anonymized_telemetry=False)
+        )
         self.metadata_loader = MetadataLoader()
         
     def process_schema_file(self, schema_file: str) -> List[Dict[str, Any]]:
@@ -173,20 +175,26 @@ class SchemaProcessor:
                 embedding_function=self.embedding_function
             )
             
-            # Get existing IDs
+            # Get existing IDs (ids only - skip documents/metadatas payload)
             try:
-                existing_ids = collection.get()["ids"]
+                existing_ids = collection.get(include=[])["ids"]
                 if existing_ids:
                     collection.delete(ids=existing_ids)
             except Exception as e:
                 logger.warning(f"Error clearing existing embeddings: {str(e)}")
             
-            # Add new embeddings
-            collection.add(
-                documents=schema_docs,
+            # Add new embeddings in chunks the backend can accept
+            for batch_ids, _, batch_metadatas, batch_docs in create_batches(
+                api=self.chroma_client,
+                ids=schema_ids,
                 metadatas=schema_metadatas,
-                ids=schema_ids
-            )
+                documents=schema_docs
+            ):
+                collection.add(
+                    documents=batch_docs,
+                    metadatas=batch_metadatas,
+                    ids=batch_ids
+                )
             
             logger.info("Successfully initialized schema embeddings")
             
@@ -196,11 +204,12 @@ class SchemaProcessor:
                 query_texts=[sample_query],
                 n_results=2
             )
-            logger.info(f"Sample query '{sample_query}' results:")
+            sample_lines = [f"Sample query '{sample_query}' results:"]
             for doc, metadata in zip(results["documents"][0], results["metadatas"][0]):
-                logger.info(f"Table: {metadata['table']}")
-                logger.info(f"Columns: {metadata.get('columns_str', '')}")
-                logger.info(f"Description: {doc[:200]}...")
+                sample_lines.append(f"Table: {metadata['table']}")
+                sample_lines.append(f"Columns: {metadata.get('columns_str', '')}")
+                sample_lines.append(f"Description: {doc[:200]}...")
+            logger.info("\n".join(sample_lines))
             
         except Exception as e:
             logger.error(f"Error initializing schema embeddings: {str(e)}")
@@ -2,16 +2,28 @@
 import logging
 import os
 import json
+import re
 from typing import Dict, Any, List, Optional, Tuple
 from .logger_config import log_agent_flow
 from .metadata_loader import MetadataLoader
 from .llm_provider import get_llm_provider
 from .sql_validator import SQLValidator
+from .executor import ExecutorAgent
 from .llm_prompt_builder import PromptingAgent
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Common SQLite error patterns that name a problematic column
+PROBLEMATIC_COLUMN_PATTERNS = [
+    re.compile(r"no such column: (\w+)"),
+    re.compile(r"column (\w+) does not exist"),
+    re.compile(r"ambiguous column name: (\w+)")
+]
+COMMA_RUN_PATTERN = re.compile(r',(?:\s*,)+')
+LEADING_COMMA_PATTERN = re.compile(r'^\s*,\s*')
+TRAILING_COMMA_PATTERN = re.compile(r',\s*$')
+
 def log_llm_interaction(prompt: str, response: Dict[str, str], attempt: int) -> None:
     """Log LLM interaction with JSON input/output"""
     try:
@@ -38,6 +50,7 @@ class SQLGeneratorAgent:
         self.metadata_loader = MetadataLoader()
         self.llm_provider = get_llm_provider()
         self.validator = SQLValidator(os.getenv("SQLITE_DB_PATH", "banking.db"))
+        self.executor = ExecutorAgent()  # reused for every test execution
         self.max_llm_attempts = 3
         self.prompting_agent = PromptingAgent()
         logger.info("Initialized SQLGeneratorAgent")
@@ -71,7 +84,8 @@ class SQLGeneratorAgent:
             
             # Log the foreign key information
             logger.info("Retrieved foreign key relationships from schema")
-            logger.debug(f"Foreign keys: {json.dumps(foreign_keys, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Foreign keys: {json.dumps(foreign_keys, indent=2)}")
             
             return foreign_keys
             
@@ -252,21 +266,16 @@ class SQLGeneratorAgent:
 
     def _extract_problematic_columns(self, error_msg: str) -> List[str]:
         """Extract problematic column names from error message"""
-        problematic_columns = []
-        
-        # Common SQLite error patterns
-        error_patterns = [
-            r"no such column: (\w+)",
-            r"column (\w+) does not exist",
-            r"ambiguous column name: (\w+)"
-        ]
+        error_lower = error_msg.lower()
         
-        import re
-        for pattern in error_patterns:
-            matches = re.findall(pattern, error_msg.lower())
-            problematic_columns.extend(matches)
+        # Collect matches straight into a set to drop duplicates as we go
+        problematic_columns = {
+            match.group(1)
+            for pattern in PROBLEMATIC_COLUMN_PATTERNS
+            for match in pattern.finditer(error_lower)
+        }
         
-        return list(set(problematic_columns))  # Remove duplicates
+        return list(problematic_columns)
 
     def _create_simplified_query(self, original_sql: str, excluded_columns: List[str]) -> str:
         """Create a simplified query excluding problematic columns"""
@@ -287,14 +296,13 @@ class SQLGeneratorAgent:
             # Extract SELECT clause
             select_clause = original_sql[select_start:from_start]
             
-            # Remove problematic columns
-            import re
-            for col in excluded_columns:
-                # Remove the column from SELECT clause
-                select_clause = re.sub(rf'\b{col}\b', '', select_clause, flags=re.IGNORECASE)
-                select_clause = re.sub(r',\s*,', ',', select_clause)  # Clean up double commas
-                select_clause = re.sub(r'^\s*,\s*', '', select_clause)  # Remove leading comma
-                select_clause = re.sub(r',\s*$', '', select_clause)  # Remove trailing comma
+            # Remove all problematic columns from the SELECT clause in one pass
+            if excluded_columns:
+                columns_pattern = '|'.join(re.escape(col) for col in excluded_columns)
+                select_clause = re.sub(rf'\b(?:{columns_pattern})\b', '', select_clause, flags=re.IGNORECASE)
+                select_clause = COMMA_RUN_PATTERN.sub(',', select_clause)  # Collapse runs of commas
+                select_clause = LEADING_COMMA_PATTERN.sub('', select_clause)  # Remove leading comma
+                select_clause = TRAILING_COMMA_PATTERN.sub('', select_clause)  # Remove trailing comma
             
             # Reconstruct SQL
             simplified_sql = select_clause + original_sql[from_start:]
@@ -309,9 +317,7 @@ class SQLGeneratorAgent:
         """Test SQL execution against the database"""
         try:
             # Use the executor to test the SQL
-            from .executor import ExecutorAgent
-            executor = ExecutorAgent()
-            exec_result = executor.run_query(sql, limit=1)
+            exec_result = self.executor.run_query(sql, limit=1)
             return exec_result
         except Exception as err:
             return {"success": False, "error": str(err)}
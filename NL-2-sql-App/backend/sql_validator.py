@@ -11,6 +11,10 @@ class SQLValidator:
         'DROP', 'DELETE', 'TRUNCATE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE',
         'MODIFY', 'RENAME', 'REPLACE', 'GRANT', 'REVOKE'
     }
+    # One pass over the query for any dangerous keyword, matched as a whole word
+    DANGEROUS_KEYWORD_PATTERN = re.compile(r'\b(' + '|'.join(sorted(DANGEROUS_KEYWORDS)) + r')\b')
+    # Table identifier following FROM/JOIN, compiled once for every validation
+    TABLE_REFERENCE_PATTERN = re.compile(r'(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
     
     def __init__(self, db_path: str):
         self.db_path = db_path
@@ -28,9 +32,9 @@ class SQLValidator:
             
         # Check for dangerous keywords
         sql_upper = sql.upper()
-        for keyword in self.DANGEROUS_KEYWORDS:
-            if keyword in sql_upper:
-                return False, f"Dangerous keyword '{keyword}' found in query"
+        match = self.DANGEROUS_KEYWORD_PATTERN.search(sql_upper)
+        if match:
+            return False, f"Dangerous keyword '{match.group(1)}' found in query"
                 
         # Must be a SELECT query
         if not sql_upper.startswith('SELECT'):
@@ -45,11 +49,8 @@ class SQLValidator:
 
     def _has_valid_identifiers(self, sql: str) -> bool:
         """Check if SQL contains valid identifiers"""
-        # Basic pattern for SQL identifiers
-        identifier_pattern = r'[a-zA-Z_][a-zA-Z0-9_]*'
-        
         # Extract all identifiers after FROM, JOIN, and table aliases
-        tables = re.findall(r'(?:FROM|JOIN)\s+(' + identifier_pattern + ')', sql, re.IGNORECASE)
+        tables = self.TABLE_REFERENCE_PATTERN.findall(sql)
         if not tables:
             return False
             
@@ -35,7 +35,6 @@ class SummarizerAgent:
 
         # Convert results to DataFrame for analysis
         df = pd.DataFrame(results)
-        total_rows = len(df)
         
         # Get query context
         query_lower = query.lower()
@@ -70,8 +69,9 @@ class SummarizerAgent:
 
         # Add manager statistics if available
         if 'manager_name' in df.columns:
+            # One pass over the column; the complement falls out of the row count
             managed_count = df['manager_name'].notna().sum()
-            unmanaged_count = df['manager_name'].isna().sum()
+            unmanaged_count = total_branches - managed_count
             summary_parts.append(f"\n**Management Overview:**")
             summary_parts.append(f"• Branches with managers: **{managed_count}**")
             summary_parts.append(f"• Branches without managers: **{unmanaged_count}**")
@@ -4,6 +4,8 @@ from typing import Dict, Any
 from .logger_config import log_agent_flow
 
 class ValidatorAgent:
+    FORBIDDEN_KEYWORDS = ("DROP", "DELETE", "UPDATE", "INSERT", "ALTER")
+
     def __init__(self, schema_tables: dict):
         """
         schema_tables = {
@@ -13,6 +15,8 @@ class ValidatorAgent:
         }
         """
         self.schema_tables = schema_tables
+        # (table, TABLE) pairs, upper-cased once here rather than on every validate() call
+        self._table_name_pairs = [(table, table.upper()) for table in schema_tables]
 
     @log_agent_flow("ValidatorAgent")
     def validate(self, sql: str) -> Dict[str, Any]:
@@ -35,10 +39,10 @@ class ValidatorAgent:
                 "error": "Only SELECT statements are allowed"
             }
 
-        # 2. Block dangerous keywords
-        forbidden = ["DROP", "DELETE", "UPDATE", "INSERT", "ALTER"]
-        for word in forbidden:
-            if word in tokens:
+        # 2. Block dangerous keywords (set lookup instead of rescanning the token list)
+        token_set = set(tokens)
+        for word in self.FORBIDDEN_KEYWORDS:
+            if word in token_set:
                 return {
                     "is_valid": False,
                     "error": f"Forbidden operation detected: {word}"
@@ -49,8 +53,8 @@ class ValidatorAgent:
         
         # Check if any known table is mentioned
         tables_found = []
-        for table in self.schema_tables:
-            if table.upper() in sql_str:
+        for table, table_upper in self._table_name_pairs:
+            if table_upper in sql_str:
                 tables_found.append(table)
         
         if not tables_found:
@@ -3,6 +3,13 @@ import json
 from typing import Dict, Any
 import pandas as pd
 
+STATUS_COLORS = {
+    'started': '🟡',
+    'completed': '🟢',
+    'failed': '🔴',
+    'unknown': '⚪'
+}
+
 def render_json(data: Any) -> None:
     """Render JSON data in a formatted way"""
     if isinstance(data, str):
@@ -28,12 +35,7 @@ def render_agent_flow_tabs(agent_data: Dict[str, Any]) -> None:
         # Create status indicators
         for agent_name, state in agent_data['agent_states'].items():
             status = state.get('status', 'unknown')
-            status_color = {
-                'started': '🟡',
-                'completed': '🟢',
-                'failed': '🔴',
-                'unknown': '⚪'
-            }.get(status, '⚪')
+            status_color = STATUS_COLORS.get(status, '⚪')
             
             st.markdown(f"{status_color} **{agent_name}**: {status}")
     
@@ -4,6 +4,13 @@ import json
 from typing import Dict, Any, List
 import pandas as pd
 
+STATUS_ICONS = {
+    'started': '🟡',
+    'completed': '🟢',
+    'failed': '🔴',
+    'pending': '⚪'
+}
+
 def format_json(data: Any) -> str:
     """Format JSON data for display"""
     if isinstance(data, str):
@@ -28,13 +35,7 @@ def render_agent_io(input_data: Any, output_data: Any, agent_name: str):
 
 def render_agent_status(status: str):
     """Render agent status with appropriate icon"""
-    status_icons = {
-        'started': '🟡',
-        'completed': '🟢',
-        'failed': '🔴',
-        'pending': '⚪'
-    }
-    icon = status_icons.get(status.lower(), '⚪')
+    icon = STATUS_ICONS.get(status.lower(), '⚪')
     st.markdown(f"### Status: {icon} {status}")
 
 def extract_agent_io(state: Dict[str, Any], agent_name: str) -> tuple:
@@ -4,11 +4,38 @@ Test Runner Script for NL-2-SQL Application
 This script runs all tests and generates comprehensive coverage reports.
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
+from collections import deque
 from pathlib import Path
 
+def stream_command(cmd, tail_lines=200):
+    """Run a command, echoing its output line by line as it is produced"""
+    # Flush our own buffered output so it lands before the child's
+    sys.stdout.flush()
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    tail = deque(maxlen=tail_lines)
+    for line in process.stdout:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        tail.append(line)
+    returncode = process.wait()
+    
+    # Repeat the end of the log on failure, without keeping the whole run in memory
+    if returncode != 0 and tail:
+        print(f"\n📋 Last {len(tail)} lines of output:")
+        sys.stdout.writelines(tail)
+        sys.stdout.flush()
+    return returncode
+
 def run_tests():
     """Run all tests with coverage"""
     print("🧪 Running NL-2-SQL Application Tests")
@@ -20,7 +47,7 @@ def run_tests():
     
     # Run tests with coverage
     cmd = [
-        "uv", "run", "pytest", 
+        sys.executable, "-m", "pytest",
         "tests/", 
         "--cov=backend", 
         "--cov-report=term-missing",
@@ -29,25 +56,23 @@ def run_tests():
         "-v"
     ]
     
+    # Spread tests across cores when pytest-xdist is available
+    if importlib.util.find_spec("xdist") is not None:
+        cmd.extend(["-n", "auto"])
+    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
         print("📊 Test Results:")
-        print(result.stdout)
+        returncode = stream_command(cmd)
         
-        if result.stderr:
-            print("⚠️  Errors/Warnings:")
-            print(result.stderr)
-        
-        print(f"✅ Tests completed with exit code: {result.returncode}")
+        print(f"✅ Tests completed with exit code: {returncode}")
         
         # Generate summary
-        if result.returncode == 0:
+        if returncode == 0:
             print("\n🎉 All tests passed!")
         else:
             print("\n❌ Some tests failed. Check the output above for details.")
         
-        return result.returncode == 0
+        return returncode == 0
         
     except Exception as e:
         print(f"❌ Error running tests: {e}")
@@ -59,22 +84,14 @@ def run_specific_test_suite(suite_name):
     print("=" * 30)
     
     cmd = [
-        "uv", "run", "pytest", 
+        sys.executable, "-m", "pytest",
         f"tests/test_{suite_name.lower()}.py",
         "-v"
     ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
         print("📊 Test Results:")
-        print(result.stdout)
-        
-        if result.stderr:
-            print("⚠️  Errors/Warnings:")
-            print(result.stderr)
-        
-        return result.returncode == 0
+        return stream_command(cmd) == 0
         
     except Exception as e:
         print(f"❌ Error running {suite_name} tests: {e}")
@@ -0,0 +1,14 @@
+"""Shared pytest fixtures"""
+import pytest
+
+
+@pytest.fixture
+def sample_schema_tables():
+    """Fresh copy of the banking schema table -> columns map for each test"""
+    return {
+        "customers": ["id", "first_name", "last_name", "email", "phone", "address", "date_of_birth", "gender", "national_id", "created_at", "updated_at", "branch_id"],
+        "accounts": ["id", "customer_id", "account_number", "type", "balance", "opened_at", "interest_rate", "status", "branch_id", "created_at", "updated_at"],
+        "branches": ["id", "name", "address", "city", "state", "zip_code", "manager_id", "created_at", "updated_at"],
+        "employees": ["id", "branch_id", "name", "email", "phone", "position", "hire_date", "salary", "created_at", "updated_at"],
+        "transactions": ["id", "account_id", "transaction_date", "amount", "type", "description", "status", "created_at", "updated_at", "employee_id"]
+    }
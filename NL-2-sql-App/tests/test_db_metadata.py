@@ -1,12 +1,7 @@
 import pytest
-import sys
-import os
 import json
 from unittest.mock import Mock, patch, MagicMock, mock_open
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.db_metadata import DBMetadata
 
 
@@ -1,11 +1,13 @@
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 import json
-
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+from openai import (
+    APITimeoutError,
+    AuthenticationError,
+    BadRequestError,
+    PermissionDeniedError,
+    RateLimitError,
+)
 
 from backend.llm_provider import LLMProvider, OpenAIProvider
 
@@ -83,8 +85,6 @@ class TestOpenAIProvider:
     
     def test_generate_text_rate_limit_error(self):
         """Test handling of rate limit error"""
-        from openai import RateLimitError
-        
         self.mock_openai.OpenAI.return_value.chat.completions.create.side_effect = RateLimitError("Rate limit exceeded", response=Mock(), body=None)
         
         with pytest.raises(RateLimitError):
@@ -92,8 +92,6 @@ class TestOpenAIProvider:
     
     def test_generate_text_timeout_error(self):
         """Test handling of timeout error"""
-        from openai import APITimeoutError
-        
         self.mock_openai.OpenAI.return_value.chat.completions.create.side_effect = APITimeoutError("Request timeout", request=Mock())
         
         with pytest.raises(APITimeoutError):
@@ -101,8 +99,6 @@ class TestOpenAIProvider:
     
     def test_generate_text_authentication_error(self):
         """Test handling of authentication error"""
-        from openai import AuthenticationError
-        
         self.mock_openai.OpenAI.return_value.chat.completions.create.side_effect = AuthenticationError("Invalid API key", response=Mock(), body=None)
         
         with pytest.raises(AuthenticationError):
@@ -110,17 +106,13 @@ class TestOpenAIProvider:
     
     def test_generate_text_permission_error(self):
         """Test handling of permission error"""
-        from openai import PermissionError
-        
-        self.mock_openai.OpenAI.return_value.chat.completions.create.side_effect = PermissionError("Insufficient permissions", response=Mock(), body=None)
+        self.mock_openai.OpenAI.return_value.chat.completions.create.side_effect = PermissionDeniedError("Insufficient permissions", response=Mock(), body=None)
         
-        with pytest.raises(PermissionError):
+        with pytest.raises(PermissionDeniedError):
             self.provider.generate_text("Test prompt")
     
     def test_generate_text_bad_request_error(self):
         """Test handling of bad request error"""
-        from openai import BadRequestError
-        
         self.mock_openai.OpenAI.return_value.chat.completions.create.side_effect = BadRequestError("Invalid request", response=Mock(), body=None)
         
         with pytest.raises(BadRequestError):
@@ -427,12 +419,8 @@ class TestOpenAIProvider:
         
         result = self.provider.generate_text("Test prompt")
         
-        # Validate that the response is valid JSON
-        try:
-            json.loads(result)
-            assert True
-        except json.JSONDecodeError:
-            assert False, "Response should be valid JSON"
+        # Validate that the response is valid JSON (json.loads raises otherwise)
+        json.loads(result)
     
     def test_generate_text_with_empty_response(self):
         """Test text generation with empty response"""
@@ -1,12 +1,7 @@
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock, mock_open
 import json
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.metadata_loader import MetadataLoader
 
 
@@ -1,11 +1,6 @@
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.pipeline import NL2SQLPipeline
 
 
@@ -1,11 +1,6 @@
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.planner import PlannerAgent
 from backend.metadata_loader import MetadataLoader
 
@@ -13,15 +8,10 @@ from backend.metadata_loader import MetadataLoader
 class TestPlannerAgent:
     """Test cases for PlannerAgent"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, sample_schema_tables):
         """Setup test fixtures"""
-        self.schema_map = {
-            "customers": ["id", "first_name", "last_name", "email", "phone", "address", "date_of_birth", "gender", "national_id", "created_at", "updated_at", "branch_id"],
-            "accounts": ["id", "customer_id", "account_number", "type", "balance", "opened_at", "interest_rate", "status", "branch_id", "created_at", "updated_at"],
-            "branches": ["id", "name", "address", "city", "state", "zip_code", "manager_id", "created_at", "updated_at"],
-            "employees": ["id", "branch_id", "name", "email", "phone", "position", "hire_date", "salary", "created_at", "updated_at"],
-            "transactions": ["id", "account_id", "transaction_date", "amount", "type", "description", "status", "created_at", "updated_at", "employee_id"]
-        }
+        self.schema_map = sample_schema_tables
         
         with patch('backend.planner.MetadataLoader'):
             self.planner = PlannerAgent(self.schema_map)
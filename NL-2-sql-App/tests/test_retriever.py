@@ -1,11 +1,6 @@
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.retriever import RetrieverAgent
 
 
@@ -257,3 +252,68 @@ class TestRetrieverAgent:
         # Test collection creation and management
         assert hasattr(self.retriever, 'client')
         assert self.retriever.client is not None
+
+
+class TestRetrieverClientReuse:
+    """Test cases for sharing an existing ChromaDB client"""
+    
+    def test_init_reuses_supplied_client(self):
+        """Test RetrieverAgent uses the given client instead of opening a new one"""
+        client = Mock()
+        with patch('backend.retriever.chromadb.PersistentClient') as mock_persistent:
+            retriever = RetrieverAgent(db_path="./test_chroma_db", client=client)
+        
+        mock_persistent.assert_not_called()
+        assert retriever.client is client
+        client.get_or_create_collection.assert_called_once_with("database_schema")
+
+
+class TestRetrieverCircuitBreaker:
+    """Test cases for short-circuiting ChromaDB after a failure"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.client = Mock()
+        self.collection = self.client.get_or_create_collection.return_value
+        self.collection.query.side_effect = RuntimeError("chroma unavailable")
+        self.retriever = RetrieverAgent(db_path="./test_chroma_db", client=self.client)
+    
+    def test_failure_opens_breaker(self):
+        """Test later calls skip ChromaDB once a query has failed"""
+        first = self.retriever.fetch_schema_context("Show me all customers")
+        second = self.retriever.fetch_schema_context("Show me all accounts")
+        
+        assert self.collection.query.call_count == 1
+        assert first["tables_found"] == second["tables_found"]
+        assert second["metadata"] == []
+    
+    def test_breaker_resets_after_cooldown(self):
+        """Test ChromaDB is probed again once the cool-down has elapsed"""
+        self.retriever.fetch_schema_context("Show me all customers")
+        self.retriever._breaker_opened_at -= RetrieverAgent.BREAKER_RESET_SECONDS
+        self.retriever.fetch_schema_context("Show me all customers")
+        
+        assert self.collection.query.call_count == 2
+    
+    def test_enrichment_error_does_not_open_breaker(self):
+        """Test a failure after a successful ChromaDB query keeps the breaker closed"""
+        self.collection.query.side_effect = None
+        self.collection.query.return_value = {
+            "documents": [["Table 'customers': customer records"]],
+            "metadatas": [[{"table": "customers"}]]
+        }
+        self.retriever.metadata_loader = Mock()
+        self.retriever.metadata_loader.get_table_metadata.side_effect = RuntimeError("bad metadata")
+        self.retriever.metadata_loader.get_metadata.return_value = {"tables": {}}
+        
+        self.retriever.fetch_schema_context("Show me all customers")
+        
+        assert self.retriever._breaker_opened_at is None
+    
+    def test_column_lookup_failure_opens_breaker(self):
+        """Test get_table_columns trips the breaker and then skips ChromaDB"""
+        self.retriever.get_table_columns("customers")
+        self.retriever.get_table_columns("accounts")
+        self.retriever.get_foreign_keys("accounts")
+        
+        assert self.collection.query.call_count == 1
@@ -247,7 +247,9 @@ def test_prompting_agent():
 @pytest.fixture
 def sql_generator(mock_llm_provider, metadata_loader, mock_validator, test_prompting_agent):
     """Initialize SQLGeneratorAgent with mocked dependencies"""
-    generator = SQLGeneratorAgent()
+    # Hand the mock to __init__ so no OpenAI key is needed to build the agent
+    with patch('backend.sql_generator.get_llm_provider', return_value=mock_llm_provider):
+        generator = SQLGeneratorAgent()
     generator.llm_provider = mock_llm_provider
     generator.metadata_loader = metadata_loader
     generator.validator = mock_validator
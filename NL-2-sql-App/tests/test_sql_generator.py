@@ -1,12 +1,7 @@
 """Test cases for SQL Generator"""
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.sql_generator import SQLGeneratorAgent
 from backend.llm_prompt_builder import PromptingAgent
 from backend.llm_provider import OpenAIProvider
@@ -1,26 +1,16 @@
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
 from backend.validator import ValidatorAgent
 
 
 class TestValidatorAgent:
     """Test cases for ValidatorAgent"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, sample_schema_tables):
         """Setup test fixtures"""
-        self.schema_tables = {
-            "customers": ["id", "first_name", "last_name", "email", "phone", "address", "date_of_birth", "gender", "national_id", "created_at", "updated_at", "branch_id"],
-            "accounts": ["id", "customer_id", "account_number", "type", "balance", "opened_at", "interest_rate", "status", "branch_id", "created_at", "updated_at"],
-            "branches": ["id", "name", "address", "city", "state", "zip_code", "manager_id", "created_at", "updated_at"],
-            "employees": ["id", "branch_id", "name", "email", "phone", "position", "hire_date", "salary", "created_at", "updated_at"],
-            "transactions": ["id", "account_id", "transaction_date", "amount", "type", "description", "status", "created_at", "updated_at", "employee_id"]
-        }
+        self.schema_tables = sample_schema_tables
         self.validator = ValidatorAgent(self.schema_tables)
     
     def test_init(self):
@@ -36,37 +26,19 @@ class TestValidatorAgent:
         assert result["is_valid"] is True
         assert "customers" in result["tables_used"]
     
-    def test_validate_ddl_operation(self):
-        """Test validation of DDL operation"""
-        sql = "DROP TABLE customers"
-        result = self.validator.validate(sql)
-        
-        assert result["is_valid"] is False
-        assert "DROP" in result["error"]
-    
-    def test_validate_dml_operation(self):
-        """Test validation of DML operation"""
-        sql = "DELETE FROM customers"
-        result = self.validator.validate(sql)
-        
-        assert result["is_valid"] is False
-        assert "DELETE" in result["error"]
-    
-    def test_validate_insert_operation(self):
-        """Test validation of INSERT operation"""
-        sql = "INSERT INTO customers (name, email) VALUES ('John', 'john@example.com')"
-        result = self.validator.validate(sql)
-        
-        assert result["is_valid"] is False
-        assert "INSERT" in result["error"]
-    
-    def test_validate_update_operation(self):
-        """Test validation of UPDATE operation"""
-        sql = "UPDATE customers SET name = 'John' WHERE id = 1"
+    @pytest.mark.parametrize("sql", [
+        "DROP TABLE customers",
+        "DELETE FROM customers",
+        "INSERT INTO customers (name, email) VALUES ('John', 'john@example.com')",
+        "UPDATE customers SET name = 'John' WHERE id = 1",
+    ], ids=["drop", "delete", "insert", "update"])
+    def test_validate_forbidden_operation(self, sql):
+        """Test validation rejects DDL/DML operations"""
         result = self.validator.validate(sql)
         
+        # Non-SELECT statements are rejected before the keyword scan runs
         assert result["is_valid"] is False
-        assert "UPDATE" in result["error"]
+        assert result["error"] == "Only SELECT statements are allowed"
     
     def test_validate_complex_safe_query(self):
         """Test validation of complex but safe query"""